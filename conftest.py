@@ -3,7 +3,7 @@ from pathlib import Path
 import pytest
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def iter_md_magnetics_path():
     pth = Path(__file__).parent / "tests/iter_md_magnetics_150100_5.nc"
     if not pth.exists():
@@ -1,15 +1,59 @@
-from .exceptions import ValidationError
-from .mapping import ChannelMap, ChannelSignal, SignalMap
-from .units import UNIT_REGISTRY, UnitConversion
-from .util import calculate_streaming_metadata, get_unit_conversion_arrays
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .exceptions import ValidationError
+    from .mapping import ChannelMap, ChannelSignal, MappingStats, SignalMap
+    from .units import UNIT_REGISTRY, UnitConversion
+    from .util import (
+        apply_unit_conversion,
+        calculate_streaming_metadata,
+        get_unit_conversion_arrays,
+    )
 
 __all__ = [
     "UNIT_REGISTRY",
     "UnitConversion",
     "ChannelMap",
     "ChannelSignal",
+    "MappingStats",
     "SignalMap",
     "ValidationError",
+    "apply_unit_conversion",
     "calculate_streaming_metadata",
     "get_unit_conversion_arrays",
 ]
+
+# Submodules are imported on first access of their public names (see __getattr__).
+# This keeps ``import imas_iter_mapping.cli`` fast: importing imas and pint takes
+# much longer than, for example, displaying the command line help.
+_SUBMODULES = {
+    "UNIT_REGISTRY": ".units",
+    "UnitConversion": ".units",
+    "ChannelMap": ".mapping",
+    "ChannelSignal": ".mapping",
+    "MappingStats": ".mapping",
+    "SignalMap": ".mapping",
+    "ValidationError": ".exceptions",
+    "apply_unit_conversion": ".util",
+    "calculate_streaming_metadata": ".util",
+    "get_unit_conversion_arrays": ".util",
+}
+
+# Submodules are also available as attributes of the package, like they were with eager
+# imports. Importing a submodule binds it to the package, so this is only needed once.
+_LAZY_SUBMODULES = ("exceptions", "mapping", "units", "util")
+
+
+def __getattr__(name: str):
+    if name in _LAZY_SUBMODULES:
+        return import_module(f".{name}", __name__)
+    if name not in _SUBMODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_SUBMODULES[name], __name__), name)
+    globals()[name] = value  # Skip __getattr__ for subsequent lookups
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__, *_LAZY_SUBMODULES})
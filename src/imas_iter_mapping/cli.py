@@ -1,13 +1,15 @@
 import logging
 import os
 import sys
-from typing import TextIO
+from collections.abc import Callable
+from typing import TextIO, TypeVar
 
 import click
-from imas.ids_struct_array import IDSStructArray
-from strictyaml.ruamel.error import YAMLError
 
-from imas_iter_mapping import SignalMap, ValidationError
+# N.B. imas_iter_mapping (and its dependencies imas, pint, etc.) are imported inside the
+# commands, which keeps the command line interface responsive (e.g. for --help).
+
+T = TypeVar("T")
 
 
 @click.group(invoke_without_command=True, no_args_is_help=True)
@@ -17,10 +19,14 @@ def main() -> None:
         logging.getLogger("imas").setLevel(logging.WARNING)
 
 
-def try_parse(mapping_file: TextIO) -> SignalMap:
+def try_parse(mapping_file: TextIO, parse: Callable[[TextIO], T]) -> T:
     """Try to parse a mapping file, and display an error message if that fails."""
+    from strictyaml.ruamel.error import YAMLError
+
+    from imas_iter_mapping import ValidationError
+
     try:
-        return SignalMap.from_yaml(mapping_file)
+        return parse(mapping_file)
     except YAMLError as exc:
         # YAML or StrictYAML error
         click.echo("File contains invalid (strict) YAML:")
@@ -50,18 +56,43 @@ def validate(mapping_file: TextIO, quiet: bool) -> None:
     Arguments:
         MAPPING_FILE: Mapping file to validate (or '-' to read from stdin).
     """
+    from imas_iter_mapping import SignalMap
+
     if not quiet:
         click.echo(f'Validating "{mapping_file.name}" ...')
-    try_parse(mapping_file)
+    try_parse(mapping_file, SignalMap.from_yaml)
     if not quiet:
         click.echo(f"Success: {mapping_file.name} is a valid IMAS ITER Mapping file")
 
 
 @main.command("describe")
 @click.argument("mapping_file", type=click.File())
-def describe(mapping_file: TextIO) -> None:
+@click.option(
+    "--quick/--full",
+    help="Only count the mapped signals, without validating the mapping file and "
+    "loading the Machine Description (default: --full).",
+)
+def describe(mapping_file: TextIO, quick: bool) -> None:
     """Display statistics about the mapping file and associated machine description"""
-    map = try_parse(mapping_file)
+    from imas_iter_mapping import SignalMap, UnitConversion
+
+    if quick:
+        stats = try_parse(mapping_file, SignalMap.quick_stats)
+        click.echo(
+            f'IMAS-ITER-Mapping file "{mapping_file.name}" maps '
+            f"{sum(stats.num_signals.values())} signals to the {stats.target_ids} IDS."
+        )
+        click.echo()
+        for ids_path, num_channels in stats.num_channels.items():
+            click.echo(
+                f"- '{ids_path}' has {num_channels} channels with "
+                f"{stats.num_signals[ids_path]} mapped signals."
+            )
+        return
+
+    from imas.ids_struct_array import IDSStructArray
+
+    map = try_parse(mapping_file, SignalMap.from_yaml)
 
     click.echo(
         f'IMAS-ITER-Mapping file "{mapping_file.name}" maps '
@@ -86,7 +117,14 @@ def describe(mapping_file: TextIO) -> None:
             f"{len(channels)} ({len(channels) / len(node):.0%}) have mapped signals."
         )
         if len(channels) != 0:
-            num_signals = sum(len(channel.signals) for channel in channels)
+            signals = [signal for channel in channels for signal in channel.signals]
+            num_signals = len(signals)
+            # Count signals with a unit conversion, calculating each unique
+            # conversion only once:
+            conversions = UnitConversion.calculate_many(
+                (signal.source_units, signal.dd_units) for signal in signals
+            )
+            num_unit_conversions = sum(conv != (1, 0) for conv in conversions)
             avg_mapped = num_signals / len(channels)
             click.echo(
                 f"  {num_signals} signals are mapped. That is, on average, "
@@ -94,12 +132,6 @@ def describe(mapping_file: TextIO) -> None:
             )
 
             # unit conversions
-            num_unit_conversions = sum(
-                1
-                for channel in channels
-                for signal in channel.signals
-                if signal.get_unit_conversion() != (1, 0)
-            )
             click.echo(
                 f"  {num_unit_conversions} signals "
                 f"({num_unit_conversions / num_signals:.0%}) have a unit that "
@@ -1,8 +1,14 @@
 from collections.abc import Iterator
 from contextlib import contextmanager
 
+import yaml
 from strictyaml.representation import YAML
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML was built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
 
 class ValidationError(ValueError):
     """Custom error class that keeps of the position in the yaml document"""
@@ -19,8 +25,47 @@ class ValidationError(ValueError):
         self.yaml_path = yaml_path
         self._full_message = [f"ValidationError: {msg}"]
 
-    def set_yaml_and_label(self, yaml: YAML, label: str) -> None:
-        """Enrich the error message by providing the parsed yaml and filename label"""
+    def set_yaml_and_label(self, yaml_doc: str | YAML, label: str) -> None:
+        """Enrich the error message by providing the yaml document and filename label
+
+        Args:
+            yaml_doc: The YAML document, either as text (when it was loaded with
+                PyYAML) or as parsed by strictyaml.
+            label: Filename label of the document.
+        """
+        if isinstance(yaml_doc, YAML):
+            lineno, line = self._find_line_strictyaml(yaml_doc)
+        else:
+            try:
+                lineno, line = self._find_line(yaml_doc)
+            except yaml.YAMLError:
+                # Cannot locate the problematic item, keep the message without it
+                return
+        # And add to the error message text
+        self._full_message.append(f'  in "{label}", line {lineno}:')
+        self._full_message.append(f"    {line}")
+
+    def _find_line(self, yaml_string: str) -> tuple[int, str]:
+        """Find (line number, line) of the problematic item in a YAML string."""
+        # Traverse YAML path to find the problematic YAML item. For items in a mapping
+        # we point to the line of the key, for items in a sequence to the item itself.
+        node = marked_node = yaml.compose(yaml_string, Loader=_SafeLoader)
+        for item in self.yaml_path:
+            if isinstance(node, yaml.SequenceNode):
+                node = marked_node = node.value[item]
+            else:
+                marked_node, node = next(
+                    (key, value) for key, value in node.value if key.value == item
+                )
+        # Extract line number and text on that line. N.B. libyaml (and str.splitlines)
+        # also count characters such as \x85 and \u2028 as line breaks, but they are
+        # allowed inside quoted scalars. Only count newlines, like strictyaml does.
+        lineno = yaml_string.count("\n", 0, marked_node.start_mark.index)
+        line = yaml_string.split("\n")[lineno].removesuffix("\r")
+        return lineno + 1, line
+
+    def _find_line_strictyaml(self, yaml: YAML) -> tuple[int, str]:
+        """Find (line number, line) of the problematic item in a strictyaml document."""
         # Traverse YAML path to find the problematic YAML item
         for item in self.yaml_path:
             yaml = yaml[item]
@@ -32,9 +77,7 @@ class ValidationError(ValueError):
         else:  # This happens for string values inside Channel Mappings :/
             startline -= 1
             line = yaml.lines_before(1)
-        # And add to the error message text
-        self._full_message.append(f'  in "{label}", line {startline}:')
-        self._full_message.append(f"    {line}")
+        return startline, line
 
     def __str__(self) -> str:
         return "\n".join(self._full_message)
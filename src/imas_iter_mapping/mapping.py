@@ -1,17 +1,36 @@
-from dataclasses import dataclass
-from typing import Self, TextIO
+import re
+import sys
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import NamedTuple, Self, TextIO
 
-import imas
 import pint
 import strictyaml
+import yaml
 from imas.ids_data_type import IDSDataType
 from imas.ids_metadata import IDSMetadata
 from imas.ids_toplevel import IDSToplevel
 from strictyaml import Map, MapCombined, MapPattern, Seq, Str
+from yaml.constructor import ConstructorError
+from yaml.events import AliasEvent, NodeEvent, ScalarEvent
 
-from imas_iter_mapping.exceptions import ValidationError, as_validation_error
-from imas_iter_mapping.units import UNIT_REGISTRY, UnitConversion
-from imas_iter_mapping.util import load_machine_description_ids
+from imas_iter_mapping.exceptions import (
+    ValidationError,
+    _SafeLoader,
+    as_validation_error,
+)
+from imas_iter_mapping.units import (
+    UnitConversion,
+    _is_compatible,
+    _parse_quantity,
+    _parse_unit,
+)
+from imas_iter_mapping.util import (
+    _get_factory,
+    load_machine_description_channel_names,
+    load_machine_description_ids,
+)
 
 SCHEMA = Map(
     {
@@ -34,7 +53,176 @@ SCHEMA = Map(
 """StrictYAML schema for IMAS ITER Mapping"""
 
 
-@dataclass
+_SIGNAL_RE = re.compile(r"\s*(?P<signal>[^\[]*?)\s*\[(?P<unit>.*)\]", re.DOTALL)
+"""Regular expression for signal expressions: ``signal_name [unit]``"""
+
+_HEADER_KEYS = (
+    "description",
+    "data_dictionary_version",
+    "machine_description_uri",
+    "target_ids",
+)
+
+
+class _StrictLoader(_SafeLoader):
+    """PyYAML loader for the YAML subset allowed by strictyaml.
+
+    All scalars are loaded as strings (there are no implicit resolvers for numbers,
+    booleans, etc.), and duplicate or non-scalar keys and flow style collections are
+    rejected. Other features that strictyaml disallows are not detected by this loader,
+    use :func:`_uses_strict_subset` to check for those.
+    """
+
+    yaml_implicit_resolvers = {}
+
+    def construct_sequence(self, node, deep=False):
+        if node.flow_style:
+            raise ConstructorError(
+                None, None, "flow style sequences are not allowed", node.start_mark
+            )
+        return super().construct_sequence(node, deep)
+
+    def construct_mapping(self, node, deep=False):
+        if node.flow_style:
+            raise ConstructorError(
+                None, None, "flow style mappings are not allowed", node.start_mark
+            )
+        keys = set()
+        for key_node, _ in node.value:
+            if not isinstance(key_node, yaml.ScalarNode):
+                raise ConstructorError(
+                    None, None, "only scalar keys are allowed", key_node.start_mark
+                )
+            if key_node.value in keys:
+                raise ConstructorError(
+                    None, None, "duplicate keys are not allowed", key_node.start_mark
+                )
+            keys.add(key_node.value)
+        return super().construct_mapping(node, deep)
+
+
+def _uses_strict_subset(source: str | TextIO) -> bool:
+    """Check the YAML events of a document for features that strictyaml disallows.
+
+    Anchors, aliases, explicit tags, merge keys (``<<``) and tabs in plain scalars are
+    not accepted by strictyaml. Documents using them should be handled by strictyaml,
+    to reject them with the same error messages.
+    """
+    for event in yaml.parse(source, Loader=_SafeLoader):
+        if not isinstance(event, NodeEvent):
+            continue
+        if isinstance(event, AliasEvent) or event.anchor is not None:
+            return False
+        if event.tag is not None:
+            return False
+        is_plain_scalar = isinstance(event, ScalarEvent) and not event.style
+        if is_plain_scalar and ("\t" in event.value or event.value == "<<"):
+            return False
+    return True
+
+
+def _matches_schema(data) -> bool:
+    """Check that data loaded with :class:`_StrictLoader` adheres to the SCHEMA."""
+    if not isinstance(data, dict) or data.keys() != {*_HEADER_KEYS, "signals"}:
+        return False
+    if not all(isinstance(data[key], str) for key in _HEADER_KEYS):
+        return False
+    if not isinstance(data["signals"], dict):
+        return False
+    for channels in data["signals"].values():
+        if not isinstance(channels, list):
+            return False
+        for channel in channels:
+            if not isinstance(channel, dict) or "name" not in channel:
+                return False
+            if not all(isinstance(value, str) for value in channel.values()):
+                return False
+    return True
+
+
+def _yaml_source(yaml: str | TextIO) -> tuple[str | TextIO, Callable[[], str], str]:
+    """Prepare YAML input for parsing.
+
+    Returns the YAML source to parse, a function to (re-)read the YAML text and a label
+    (filename) for error messages. Seekable streams are parsed directly, their text is
+    only read when it is needed for an error message. Other streams (e.g. stdin, or
+    file-like objects that only provide ``read``) are read into a string.
+    """
+    if isinstance(yaml, str):
+        return yaml, lambda: yaml, "<unicode string>"
+    label = getattr(yaml, "name", "<stream>")
+    seekable = getattr(yaml, "seekable", None)
+    if seekable is None or not seekable():
+        yaml_string = yaml.read()
+        return yaml_string, lambda: yaml_string, label
+    start = yaml.tell()
+
+    def read_text() -> str:
+        yaml.seek(start)
+        return yaml.read()
+
+    return yaml, read_text, label
+
+
+def _load_yaml(
+    source: str | TextIO, read_text: Callable[[], str], label: str
+) -> tuple[dict, strictyaml.representation.YAML | None]:
+    """Load and validate YAML against the SCHEMA.
+
+    The YAML is parsed with (libyaml-backed) PyYAML, which is much faster than
+    strictyaml. When that fails, when the document uses YAML features outside the
+    strictyaml subset, or when it does not adhere to the SCHEMA, strictyaml is used
+    instead. strictyaml either produces a detailed error message,
+    or accepts a document that PyYAML couldn't load.
+
+    Returns the loaded data and, when it was loaded by strictyaml, the parsed
+    strictyaml document (to locate errors in).
+    """
+    start = None if isinstance(source, str) else source.tell()
+    try:
+        data = None
+        if _uses_strict_subset(source):
+            if start is not None:
+                source.seek(start)
+            data = yaml.load(source, Loader=_StrictLoader)
+    except yaml.YAMLError:
+        pass
+    if _matches_schema(data):
+        return data, None
+    # Raises a YAMLError describing what is wrong with the document:
+    parsed_yaml = strictyaml.load(read_text(), schema=SCHEMA, label=label)
+    return parsed_yaml.data, parsed_yaml
+
+
+class _ReadOnlyDict(dict):
+    """Dictionary that cannot be modified after creation.
+
+    Unlike ``types.MappingProxyType``, this can still be (deep)copied and pickled.
+    """
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(f"'{type(self).__name__}' object is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        # Reconstruct from a plain dict, the default would use __setitem__
+        return (type(self), (dict(self),))
+
+
+class MappingStats(NamedTuple):
+    """Statistics of a mapping file, see :meth:`SignalMap.quick_stats`."""
+
+    target_ids: str
+    """IDS name that all signals map to."""
+    num_channels: dict[str, int]
+    """Number of mapped channels per IDS path."""
+    num_signals: dict[str, int]
+    """Number of mapped signals per IDS path."""
+
+
+@dataclass(slots=True, frozen=True)
 class SignalMap:
     """Map of CODAC signals to the IMAS Data Dictionary."""
 
@@ -46,16 +234,17 @@ class SignalMap:
     """(IMAS) URI of a dataset containing machine description data."""
     target_ids: str
     """IDS name that all signals map to."""
-    signals: dict[str, list["ChannelMap"]]
+    signals: Mapping[str, Sequence["ChannelMap"]]
+    """Mapped channels per IDS path. After creation, this is a read-only mapping of
+    tuples."""
+
+    _machine_description: IDSToplevel = field(init=False, repr=False, compare=False)
+    _num_signals: int = field(init=False, repr=False, compare=False)
 
     @property
     def num_signals(self) -> int:
         """The number of mapped signals"""
-        return sum(
-            len(channel.signals)
-            for channels in self.signals.values()
-            for channel in channels
-        )
+        return self._num_signals
 
     @property
     def machine_description(self) -> IDSToplevel:
@@ -64,18 +253,53 @@ class SignalMap:
 
     @classmethod
     def from_yaml(cls, yaml: str | TextIO) -> Self:
-        """Create a Signal Map from the provided yaml string."""
+        """Create a Signal Map from the provided yaml string.
+
+        Signal Maps created from a string are cached: parsing the same string again
+        returns the same (shared) Signal Map object. Signal Maps are immutable, so this
+        is safe.
+        """
         if isinstance(yaml, str):
-            yaml_string, label = yaml, "<unicode string>"
-        else:
-            yaml_string, label = yaml.read(), yaml.name
-        parsed_yaml = strictyaml.load(yaml_string, schema=SCHEMA, label=label)
+            return cls._from_yaml_string(yaml)
+        return cls._from_yaml(yaml)
+
+    @classmethod
+    @lru_cache(maxsize=32)
+    def _from_yaml_string(cls, yaml: str) -> Self:
+        return cls._from_yaml(yaml)
+
+    @classmethod
+    def _from_yaml(cls, yaml: str | TextIO) -> Self:
+        source, read_text, label = _yaml_source(yaml)
+        data, parsed_yaml = _load_yaml(source, read_text, label)
         try:
-            return cls(**parsed_yaml.data)
+            return cls(**data)
         except ValidationError as exc:
-            exc.set_yaml_and_label(parsed_yaml, label)
+            exc.set_yaml_and_label(
+                read_text() if parsed_yaml is None else parsed_yaml, label
+            )
             raise exc
 
+    @staticmethod
+    def quick_stats(yaml: str | TextIO) -> MappingStats:
+        """Count the mapped channels and signals in the provided yaml string.
+
+        Contrary to :meth:`from_yaml`, this only checks that the YAML adheres to the
+        SCHEMA. The mapped data, the Data Dictionary and the Machine Description are
+        not validated (or loaded), which makes this much faster for large mappings.
+        """
+        data, _ = _load_yaml(*_yaml_source(yaml))
+        signals = data["signals"]
+        return MappingStats(
+            data["target_ids"],
+            {ids_path: len(channels) for ids_path, channels in signals.items()},
+            {
+                # Each channel has a name and one or more paths with a mapped signal
+                ids_path: sum(len(channel) - 1 for channel in channels)
+                for ids_path, channels in signals.items()
+            },
+        )
+
     def __post_init__(self):
         """Transform signals from YAML format and validate data"""
         # Data dictionary validation
@@ -85,7 +309,7 @@ class SignalMap:
             )
         with as_validation_error(("data_dictionary_version",)):
             # Will raise a ValueError when DD version is unknown:
-            factory = imas.IDSFactory(self.data_dictionary_version)
+            factory = _get_factory(self.data_dictionary_version)
 
         # Check that the IDS name is valid
         with as_validation_error(("target_ids",)):
@@ -93,14 +317,17 @@ class SignalMap:
             factory.new(self.target_ids)
         # Load Machine Description
         with as_validation_error(("machine_description_uri",)):
-            self._machine_description = load_machine_description_ids(
+            machine_description = load_machine_description_ids(
                 self.machine_description_uri,
                 self.data_dictionary_version,
                 self.target_ids,
             )
+        # The dataclass is frozen, so bypass its __setattr__ for private fields:
+        object.__setattr__(self, "_machine_description", machine_description)
 
         # Parse signals
-        signalnames = []  # To detect duplicate signal names
+        signals: dict[str, tuple[ChannelMap, ...]] = {}
+        signalnames: set[str] = set()  # To detect duplicate signal names
         for ids_path, channels in self.signals.items():
             yaml_path = ("signals", ids_path)
             # Check that the ids_path is valid
@@ -110,73 +337,105 @@ class SignalMap:
                 raise ValidationError(
                     f"IDS path '{ids_path}' is not an array of structures", yaml_path
                 )
-            # Check if channels are already channelmaps, and create otherwise:
-            channels = [
-                channel
-                if isinstance(channel, ChannelMap)
-                else ChannelMap._from_yaml(channel, yaml_path + (i,), aosmeta)
-                for i, channel in enumerate(channels)
-            ]
-            self.signals[ids_path] = channels
-            self._validate_channels(ids_path, signalnames, yaml_path)
-
-    def _validate_channels(
-        self, ids_path: str, signalnames: list[str], yaml_path: tuple
-    ) -> None:
-        """Validation rules for channels"""
-        # Available channel names in the machine description
-        md_channelnames = [
-            str(channel.name) for channel in self._machine_description[ids_path]
-        ]
-        # Names of channels already processed (to detect duplicates)
-        channelnames = []
-
-        for i, ch in enumerate(self.signals[ids_path]):
-            # Check that channel name exists in the Machine Description
-            if ch.name not in md_channelnames:
-                raise ValidationError(
-                    f"Channel '{ch.name}' not found in the Machine Description",
-                    yaml_path + (i, "name"),
+            # Available channel names in the machine description
+            md_channelnames = load_machine_description_channel_names(
+                self.machine_description_uri,
+                self.data_dictionary_version,
+                self.target_ids,
+                ids_path,
+            )
+            # Names of channels already processed (to detect duplicates)
+            channelnames: set[str] = set()
+            # Metadata and DD units of the signal paths, shared by all channels:
+            path_info = {}
+
+            # Create and validate channels in a single pass
+            channelmaps = []
+            for i, channel in enumerate(channels):
+                # Check if channel is already a channelmap, and create otherwise:
+                if not isinstance(channel, ChannelMap):
+                    channel = ChannelMap._from_yaml(
+                        channel, yaml_path + (i,), aosmeta, path_info
+                    )
+                self._validate_channel(
+                    channel,
+                    md_channelnames,
+                    channelnames,
+                    signalnames,
+                    yaml_path + (i,),
                 )
-            # Check for duplicate IMAS channel names
-            if ch.name in channelnames:
+                channelmaps.append(channel)
+            signals[ids_path] = tuple(channelmaps)
+
+        # Store read-only signals, so they can't get out of sync with _num_signals
+        object.__setattr__(self, "signals", _ReadOnlyDict(signals))
+        # Signal names are unique, so this is the total number of mapped signals:
+        object.__setattr__(self, "_num_signals", len(signalnames))
+
+    @staticmethod
+    def _validate_channel(
+        ch: "ChannelMap",
+        md_channelnames: frozenset[str],
+        channelnames: set[str],
+        signalnames: set[str],
+        yaml_path: tuple,
+    ) -> None:
+        """Validation rules for a channel, updates channelnames and signalnames"""
+        # Check that channel name exists in the Machine Description
+        if ch.name not in md_channelnames:
+            raise ValidationError(
+                f"Channel '{ch.name}' not found in the Machine Description",
+                yaml_path + ("name",),
+            )
+        # Check for duplicate IMAS channel names
+        if ch.name in channelnames:
+            raise ValidationError(
+                f"Duplicate channel name '{ch.name}'", yaml_path + ("name",)
+            )
+        channelnames.add(ch.name)
+        # Check for duplicate signal names
+        for signal in ch.signals:
+            if signal.signal in signalnames:
                 raise ValidationError(
-                    f"Duplicate channel name '{ch.name}'",
-                    yaml_path + (i, "name"),
+                    f"Duplicate signal name '{signal.signal}'",
+                    yaml_path + (signal.path,),
                 )
-            channelnames.append(ch.name)
-            # Check for duplicate signal names
-            for signal in ch.signals:
-                if signal.signal in signalnames:
-                    raise ValidationError(
-                        f"Duplicate signal name '{signal.signal}'",
-                        yaml_path + (i, signal.path),
-                    )
-                signalnames.append(signal.signal)
+            signalnames.add(signal.signal)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ChannelMap:
     """Configures signal mapping for a single channel in an IDS."""
 
     name: str
     """Name of the channel: used to match against Machine Description data."""
-    signals: list["ChannelSignal"]
-    """List of signals within this channel."""
+    signals: tuple["ChannelSignal", ...]
+    """Signals within this channel."""
+
+    def __post_init__(self):
+        # Store signals in an immutable tuple (they may be provided as a list)
+        object.__setattr__(self, "signals", tuple(self.signals))
 
     @classmethod
     def _from_yaml(
-        cls, data: dict[str, str], yaml_path: tuple, aosmeta: IDSMetadata
+        cls,
+        data: dict[str, str],
+        yaml_path: tuple,
+        aosmeta: IDSMetadata,
+        path_info: dict[str, tuple[IDSMetadata, pint.Unit]],
     ) -> Self:
-        name = data.pop("name")
-        signals = [
-            ChannelSignal._from_yaml(path, signal, yaml_path + (path,), aosmeta)
+        name = data["name"]
+        signals = tuple(
+            ChannelSignal._from_yaml(
+                path, signal, yaml_path + (path,), aosmeta, path_info
+            )
             for path, signal in data.items()
-        ]
+            if path != "name"
+        )
         return cls(name, signals)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ChannelSignal:
     """Mapping details for a single CODAC signal"""
 
@@ -192,31 +451,40 @@ class ChannelSignal:
 
     @classmethod
     def _from_yaml(
-        cls, path: str, signal: str, yaml_path: tuple, aosmeta: IDSMetadata
+        cls,
+        path: str,
+        signal: str,
+        yaml_path: tuple,
+        aosmeta: IDSMetadata,
+        path_info: dict[str, tuple[IDSMetadata, pint.Unit]],
     ) -> Self:
-        with as_validation_error(yaml_path):
-            metadata = aosmeta[path]
-        dd_units = UNIT_REGISTRY.Unit(metadata.units)
+        # Many channels map the same paths, let them share a single string object:
+        path = sys.intern(path)
+        if path not in path_info:
+            with as_validation_error(yaml_path):
+                metadata = aosmeta[path]
+            path_info[path] = (metadata, _parse_unit(metadata.units))
+        metadata, dd_units = path_info[path]
 
         # Parse signal expression
-        signal, bracket, unit_with_bracket = signal.partition("[")
-        if not bracket:
-            raise ValidationError("Missing unit in signal mapping", yaml_path)
-        if not unit_with_bracket.endswith("]"):
+        match = _SIGNAL_RE.fullmatch(signal)
+        if match is None:
+            if "[" not in signal:
+                raise ValidationError("Missing unit in signal mapping", yaml_path)
             raise ValidationError("Was expecting a closing ']'", yaml_path)
-        unit_str = unit_with_bracket.removesuffix("]")
+        unit_str = match["unit"]
         with as_validation_error(yaml_path, f"Invalid unit [{unit_str}]"):
-            source_units = UNIT_REGISTRY.Quantity(unit_str)
+            source_units = _parse_quantity(unit_str)
 
         # Check compatibility of units
-        if not source_units.check(dd_units):
+        if not _is_compatible(source_units.units, dd_units):
             raise ValidationError(
                 f"Unit [{unit_str}] is incompatible with the IMAS "
                 f"Data Dictionary units [{metadata.units}]",
                 yaml_path,
             )
 
-        return cls(path, signal.strip(), source_units, dd_units)
+        return cls(path, match["signal"], source_units, dd_units)
 
     def get_unit_conversion(self) -> UnitConversion:
         """Get the linear coefficients for converting from source to DD units."""
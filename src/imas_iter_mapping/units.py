@@ -1,3 +1,5 @@
+from collections.abc import Iterable
+from functools import lru_cache
 from typing import NamedTuple, Self
 
 import pint
@@ -5,6 +7,25 @@ import pint
 UNIT_REGISTRY = pint.UnitRegistry()
 
 
+# Mapping files contain the same few units for many signals, and parsing units with
+# pint is relatively slow. N.B. the returned objects are shared between signals, so they
+# must not be modified.
+@lru_cache(maxsize=4096)
+def _parse_quantity(unit_str: str) -> pint.Quantity:
+    return UNIT_REGISTRY.Quantity(unit_str)
+
+
+@lru_cache(maxsize=4096)
+def _parse_unit(unit_str: str) -> pint.Unit:
+    return UNIT_REGISTRY.Unit(unit_str)
+
+
+@lru_cache(maxsize=4096)
+def _is_compatible(source_units: pint.Unit, target: pint.Unit) -> bool:
+    """Check if two units have the same dimensionality, cached per pair of units."""
+    return source_units.dimensionality == target.dimensionality
+
+
 class UnitConversion(NamedTuple):
     """Conversion factors when going from CODAC units to DD units.
 
@@ -22,7 +43,39 @@ class UnitConversion(NamedTuple):
     @classmethod
     def calculate(cls, source: pint.Quantity, target: pint.Unit) -> Self:
         """Calculate the required unit conversion."""
-        zero = UNIT_REGISTRY.Quantity(0, source.units)
-        offset = zero.to(target).magnitude
-        scale = source.to(target).magnitude - offset
-        return cls(float(scale), float(offset))
+        if source.magnitude == 1 and source.units == target:
+            # Most signals already have the DD units; no need for pint conversions
+            return cls(1.0, 0.0)
+        scale, offset = _calculate_conversion(source.units, target)
+        return cls(source.magnitude * scale, offset)
+
+    @classmethod
+    def calculate_many(
+        cls, pairs: Iterable[tuple[pint.Quantity, pint.Unit]]
+    ) -> list[Self]:
+        """Calculate the unit conversions for many (source, target) pairs.
+
+        Each unique combination of units is only calculated once.
+        """
+        conversions: dict[tuple, Self] = {}
+        result = []
+        for source, target in pairs:
+            key = (source.magnitude, source.units, target)
+            conversion = conversions.get(key)
+            if conversion is None:
+                conversion = conversions[key] = cls.calculate(source, target)
+            result.append(conversion)
+        return result
+
+
+@lru_cache(maxsize=4096)
+def _calculate_conversion(
+    source_units: pint.Unit, target: pint.Unit
+) -> tuple[float, float]:
+    """Calculate (scale, offset) of a unit conversion, for a source magnitude of 1.
+
+    The result is cached, because the same conversion is needed for many signals.
+    """
+    offset = UNIT_REGISTRY.Quantity(0, source_units).to(target).magnitude
+    scale = UNIT_REGISTRY.Quantity(1, source_units).to(target).magnitude - offset
+    return (float(scale), float(offset))
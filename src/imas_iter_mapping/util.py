@@ -3,6 +3,7 @@ import datetime
 from collections.abc import Sequence
 from functools import cache
 from importlib.metadata import distribution
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
 import imas
@@ -13,20 +14,53 @@ from imas.ids_metadata import IDSMetadata
 from imas.ids_toplevel import IDSToplevel
 from imas_streams import DynamicData, StreamingIMASMetadata
 
+from imas_iter_mapping.units import UnitConversion
+
 if TYPE_CHECKING:
     from imas_iter_mapping.mapping import ChannelSignal, SignalMap
 
+_signal_units = attrgetter("source_units", "dd_units")
+
 
 def get_unit_conversion_arrays(
     signals: list["ChannelSignal"],
 ) -> tuple[np.ndarray, np.ndarray]:
     """Determine scale and offset arrays for unit conversions of all signals."""
-    conversions = [signal.get_unit_conversion() for signal in signals]
-    scale = np.array([conversion.scale for conversion in conversions])
-    offset = np.array([conversion.offset for conversion in conversions])
+    conversions = UnitConversion.calculate_many(map(_signal_units, signals))
+    # Transpose (and copy) to get contiguous scale and offset arrays:
+    scale, offset = np.array(conversions, dtype=float).reshape(-1, 2).T.copy()
     return (scale, offset)
 
 
+def apply_unit_conversion(
+    data: np.ndarray,
+    scale: np.ndarray,
+    offset: np.ndarray,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Convert signal data to DD units: ``data * scale + offset``.
+
+    Args:
+        data: Signal data, with the signals along the last axis in the same order as
+            provided to :func:`get_unit_conversion_arrays`.
+        scale: Scale array from :func:`get_unit_conversion_arrays`.
+        offset: Offset array from :func:`get_unit_conversion_arrays`.
+        out: Optional array to store the result in. This may be ``data`` itself to
+            convert the data in-place. When not provided, a new array is allocated.
+
+    Returns:
+        The converted data (``out`` if it was provided).
+    """
+    out = np.multiply(data, scale, out=out)
+    return np.add(out, offset, out=out)
+
+
+@cache
+def _get_factory(dd_version: str) -> imas.IDSFactory:
+    """Get an IDSFactory for the given DD version, cached per version."""
+    return imas.IDSFactory(dd_version)
+
+
 @cache
 def load_machine_description_ids(
     md_uri: str, dd_version: str, ids_name: str
@@ -37,8 +71,27 @@ def load_machine_description_ids(
         return entry.get(ids_name)
 
 
-def _dynamicdata_from_ids(item) -> DynamicData:
-    """Construct DynamicData for the provided data item in an IDS"""
+@cache
+def load_machine_description_channel_names(
+    md_uri: str, dd_version: str, ids_name: str, ids_path: str
+) -> frozenset[str]:
+    """Get the names of all channels in an AoS of the machine description IDS.
+
+    The result is cached, like for :func:`load_machine_description_ids`.
+    """
+    ids = load_machine_description_ids(md_uri, dd_version, ids_name)
+    return frozenset(str(channel.name) for channel in ids[ids_path])
+
+
+def _dynamicdata_from_ids(item, full_path: str | None = None) -> DynamicData:
+    """Construct DynamicData for the provided data item in an IDS
+
+    Args:
+        item: Data item in an IDS.
+        full_path: Full path of the data item in the IDS, if already known. This
+            avoids :func:`imas.util.get_full_path`, which is O(N) inside an array
+            of structures of size N.
+    """
     metadata: IDSMetadata = item.metadata
     if metadata.ndim > 1:
         raise NotImplementedError(
@@ -47,7 +100,7 @@ def _dynamicdata_from_ids(item) -> DynamicData:
     if metadata.data_type != IDSDataType.FLT:
         raise NotImplementedError(f"Unsupported data type: {metadata.data_type}")
     return DynamicData(
-        path=imas.util.get_full_path(item),
+        path=imas.util.get_full_path(item) if full_path is None else full_path,
         shape=(1,) * metadata.ndim,  # Produces the empty tuple for 0D variables
         data_type="f64",
     )
@@ -71,13 +124,28 @@ def add_library_metadata(code, libraries: Sequence[str]) -> None:
     n_libs = len(library)
     code.library.resize(n_libs + len(libraries), keep=True)
     for i, distname in enumerate(libraries, start=n_libs):
-        dist = distribution(distname)
-        meta = dist.metadata
+        name, description, version, repository = _dist_info(distname)
 
-        library[i].name = dist.name
-        library[i].description = meta.get("summary", "")
-        library[i].version = dist.version
-        library[i].repository = meta.get("project-url", "")
+        library[i].name = name
+        library[i].description = description
+        library[i].version = version
+        library[i].repository = repository
+
+
+@cache
+def _dist_info(distname: str) -> tuple[str, str, str, str]:
+    """Get (name, description, version, repository) of an installed distribution.
+
+    The result is cached: reading the distribution metadata accesses the filesystem.
+    """
+    dist = distribution(distname)
+    meta = dist.metadata
+    return (
+        dist.name,
+        meta.get("summary", ""),
+        dist.version,
+        meta.get("project-url", ""),
+    )
 
 
 def calculate_streaming_metadata(
@@ -90,14 +158,51 @@ def calculate_streaming_metadata(
     explicitly mentioned in the metadata.
     """
     machine_description = signalmap.machine_description
-    static_data = copy.deepcopy(machine_description)
-    static_data.time = np.array([np.nan])
+    # Build the static data from a new IDS, instead of a (deep)copy of the machine
+    # description, so we only copy the channels we have a mapping for:
+    static_data = _get_factory(signalmap.data_dictionary_version).new(
+        signalmap.target_ids
+    )
 
     # List of dynamic data and corresponding list of PON signals:
     dynamic_data: list[DynamicData] = [_dynamicdata_from_ids(static_data.time)]
     signals: list[ChannelSignal] = []
 
+    # Populate paths relevant for the mapping
+    for item in machine_description.iter_nonempty_():
+        name = item.metadata.name
+        data_type = item.metadata.data_type
+        if data_type is not IDSDataType.STRUCT_ARRAY:
+            # Copy all other filled data (ids_properties, code, etc.)
+            if data_type is IDSDataType.STRUCTURE:
+                static_data[name] = copy.deepcopy(item)
+            else:
+                static_data[name] = copy.deepcopy(item.value)
+            continue
+
+        if name in signalmap.signals:
+            # We have a mapping for this array of structures:
+            channels = signalmap.signals[name]
+            channelmap = {channel.name: channel for channel in channels}
+            static_aos = static_data[name]
+            for md_child in item.value:
+                # Only copy items in the array of structures for which we map data:
+                channel = channelmap.get(str(md_child.name))
+                if channel is None:
+                    continue
+                prefix = f"{name}[{len(static_aos)}]/"
+                child = copy.deepcopy(md_child)
+                static_aos.append(child)
+                # Populate dynamic data
+                for channel_signal in channel.signals:
+                    ids_item = child[channel_signal.path]
+                    full_path = prefix + channel_signal.path
+                    dynamic_data.append(_dynamicdata_from_ids(ids_item, full_path))
+                    signals.append(channel_signal)
+        # Unmapped diagnostic channels are not copied
+
     # Fill IDS
+    static_data.time = np.array([np.nan])
     properties = static_data.ids_properties
     properties.homogeneous_time = IDS_TIME_MODE_HOMOGENEOUS
     properties.comment = "Streaming IMAS data from ITER Diagnostics"
@@ -109,31 +214,6 @@ def calculate_streaming_metadata(
     properties.provenance.node[0].reference[0].name = signalmap.machine_description_uri
     add_library_metadata(static_data.code, ("imas-streams", "imas-iter-mapping"))
 
-    # Populate paths relevant for the mapping
-    for item in static_data:
-        # Loop over all filled AoS in the IDS root and filter based on channel name
-        if item.metadata.data_type is not IDSDataType.STRUCT_ARRAY or not len(item):
-            continue
-
-        if item.metadata.name in signalmap.signals:
-            # We have a mapping for this array of structures:
-            channels = signalmap.signals[item.metadata.name]
-            channelmap = {channel.name: channel for channel in channels}
-            # Only keep items in the array of structures for which we map data:
-            mapped_children = [c for c in item if str(c.name) in channelmap]
-            item.value = mapped_children
-            # Populate dynamic data
-            for child in mapped_children:
-                channel = channelmap[str(child.name)]
-                for channel_signal in channel.signals:
-                    ids_item = child[channel_signal.path]
-                    dynamic_data.append(_dynamicdata_from_ids(ids_item))
-                    signals.append(channel_signal)
-
-        else:
-            # Clear unmapped diagnostic channels:
-            item.resize(0)
-
     # Double check that we have everything
     num_expected_fields = 1 + signalmap.num_signals  # Time is not explicitly mapped
     assert num_expected_fields == len(dynamic_data)
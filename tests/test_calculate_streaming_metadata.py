@@ -15,12 +15,12 @@ from imas_iter_mapping.util import (
 )
 
 
-@pytest.fixture(params=[False, True])
+@pytest.fixture(scope="module", params=[False, True])
 def shuffle_flux_loops(request):
     return request.param
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def full_flux_loop_mapping(iter_md_magnetics_path, shuffle_flux_loops):
     mag = load_machine_description_ids(iter_md_magnetics_path, "4.0.0", "magnetics")
 
@@ -48,7 +48,7 @@ signals:
     return SignalMap.from_yaml(mapping)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def small_mapping(iter_md_magnetics_path):
     mag = load_machine_description_ids(iter_md_magnetics_path, "4.0.0", "magnetics")
     mapping = f"""\
@@ -121,6 +121,15 @@ def test_small_mapping(iter_md_magnetics_path, small_mapping):
     # 6 mapped signals:
     assert len(signals) == 6
     assert len(metadata.dynamic_data) == 7  # Includes time as well
+    assert [data.path for data in metadata.dynamic_data] == [
+        "time",
+        "flux_loop[0]/flux/data",
+        "flux_loop[0]/voltage/data",
+        "flux_loop[1]/flux/data",
+        "flux_loop[2]/voltage/data",
+        "b_field_pol_probe[0]/field/data",
+        "b_field_pol_probe[1]/field/data",
+    ]
 
 
 def test_receive_streaming_data(small_mapping):
@@ -1,3 +1,5 @@
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
@@ -60,3 +62,28 @@ def test_describe(mapping_file):
     result = runner.invoke(main, ["describe", str(mapping_file)])
     assert result.exit_code == 0
     assert result.output != ""
+
+
+def test_describe_quick(mapping_file):
+    # The quick describe does not need the machine description
+    text = mapping_file.read_text().replace("iter_md_magnetics", "does_not_exist")
+    mapping_file.write_text(text)
+    runner = CliRunner()
+    result = runner.invoke(main, ["describe", "--quick", str(mapping_file)])
+    assert result.exit_code == 0
+    assert "maps 1 signals to the magnetics IDS" in result.output
+    assert "'flux_loop' has 1 channels with 1 mapped signals" in result.output
+
+    result = runner.invoke(main, ["describe", "--full", str(mapping_file)])
+    assert result.exit_code == 3
+
+
+def test_lazy_package_imports():
+    # Submodules and public names are available after importing just the package
+    code = """\
+import imas_iter_mapping
+assert "imas_iter_mapping.util" not in __import__("sys").modules
+assert callable(imas_iter_mapping.util.load_machine_description_ids)
+assert imas_iter_mapping.SignalMap is imas_iter_mapping.mapping.SignalMap
+"""
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -1,3 +1,5 @@
+import copy
+from dataclasses import FrozenInstanceError, asdict
 from io import StringIO
 
 import pytest
@@ -6,7 +8,7 @@ from strictyaml.ruamel.error import YAMLError
 from imas_iter_mapping import UNIT_REGISTRY, SignalMap, ValidationError
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def mapping(iter_md_magnetics_path):
     return f"""\
 description: Test mapping
@@ -55,6 +57,88 @@ def test_mapping_invalid_yaml(mapping):
             SignalMap.from_yaml("\n".join(lines))
 
 
+def test_signal_map_cached(mapping):
+    # Parsing the same string again returns the cached SignalMap
+    assert SignalMap.from_yaml(mapping) is SignalMap.from_yaml(mapping)
+    filelike = StringIO(mapping)
+    assert SignalMap.from_yaml(filelike) is not SignalMap.from_yaml(mapping)
+
+
+def test_signal_map_read_only_filelike(mapping):
+    class ReadOnlyFile:
+        name = "mapping.yaml"
+
+        def read(self, size=-1):
+            return mapping
+
+    assert SignalMap.from_yaml(ReadOnlyFile()) == SignalMap.from_yaml(mapping)
+
+
+def test_signal_map_frozen(mapping):
+    signalmap = SignalMap.from_yaml(mapping)
+    with pytest.raises(FrozenInstanceError):
+        signalmap.description = "Modified"
+    with pytest.raises(FrozenInstanceError):
+        signalmap.signals["flux_loop"][0].signals[0].signal = "Modified"
+    # Containers are read-only as well
+    with pytest.raises(TypeError):
+        signalmap.signals["b_field_pol_probe"] = ()
+    with pytest.raises(TypeError):
+        signalmap.signals["flux_loop"][0] = signalmap.signals["flux_loop"][0]
+    assert isinstance(signalmap.signals["flux_loop"][0].signals, tuple)
+
+
+def test_signal_map_copy(mapping):
+    signalmap = SignalMap.from_yaml(mapping)
+    signalmap_copy = copy.deepcopy(signalmap)
+    assert signalmap_copy == signalmap
+    assert signalmap_copy.num_signals == signalmap.num_signals
+    with pytest.raises(TypeError):
+        signalmap_copy.signals["b_field_pol_probe"] = ()
+
+    data = asdict(signalmap)
+    assert data["signals"]["flux_loop"][0]["name"] == "55.AD.00-MSA-1001"
+
+
+def test_mapping_scalars_are_strings(mapping):
+    # Values that are not strings in regular YAML should be loaded as strings
+    for value in ["yes", "123", "1.5", "null", "2025-01-01"]:
+        signalmap = SignalMap.from_yaml(mapping.replace("Test mapping", value))
+        assert signalmap.description == value
+
+
+def test_mapping_disallowed_yaml(mapping):
+    # Duplicate keys
+    with pytest.raises(YAMLError, match="Duplicate key 'voltage/data'"):
+        SignalMap.from_yaml(mapping + "    voltage/data: test [V]")
+    # Flow style
+    with pytest.raises(YAMLError, match="[Ff]low"):
+        SignalMap.from_yaml(mapping.replace("Test mapping", "{a: b}"))
+    # Complex (non-scalar) keys
+    with pytest.raises(YAMLError):
+        SignalMap.from_yaml(mapping + "    ? a: b\n    : c\n")
+    # Anchors and aliases
+    with pytest.raises(YAMLError, match="[Aa]nchor"):
+        SignalMap.from_yaml(mapping.replace("Test mapping", "&desc Test mapping"))
+    with pytest.raises(YAMLError, match="[Aa]nchor"):
+        SignalMap.from_yaml(
+            mapping.replace("name: 55", "name: &name 55").replace(
+                "[mV]", "[mV]\n  - name: *name"
+            )
+        )
+    # Explicit tags
+    with pytest.raises(YAMLError, match="[Tt]ag"):
+        SignalMap.from_yaml(mapping.replace("flux/data: ", "flux/data: !!str "))
+    with pytest.raises(YAMLError, match="[Tt]ag"):
+        SignalMap.from_yaml(mapping.replace("Test mapping", "! Test mapping"))
+    # Merge keys
+    with pytest.raises(YAMLError):
+        SignalMap.from_yaml(mapping + "    <<: test [V]")
+    # Tabs in plain scalars
+    with pytest.raises(YAMLError):
+        SignalMap.from_yaml(mapping.replace("Test mapping", "Test\tmapping"))
+
+
 def test_mapping_dd3(mapping):
     with pytest.raises(ValidationError, match="3.x is not supported") as exc:
         SignalMap.from_yaml(mapping.replace("4.0.0", "3.38.1"))
@@ -62,6 +146,32 @@ def test_mapping_dd3(mapping):
     assert exc.match("data_dictionary_version: 3.38.1")
 
 
+@pytest.mark.parametrize("char", ["\u2028", "\u0085"])
+def test_mapping_error_line_strictyaml_only(mapping, char):
+    # PyYAML cannot load these documents (while strictyaml can), so error locations
+    # must be found in the document as parsed by strictyaml
+    mapping = mapping.replace("Test mapping", f"Test{char}mapping")
+    with pytest.raises(ValidationError, match="3.x is not supported") as exc:
+        SignalMap.from_yaml(mapping.replace("4.0.0", "3.38.1"))
+    assert exc.match("line 2")
+    assert exc.match("data_dictionary_version: 3.38.1")
+
+    with pytest.raises(ValidationError, match="Unit .* is incompatible") as exc:
+        SignalMap.from_yaml(mapping.replace("[mV]", "[A.m]"))
+    assert exc.match("line 9")
+    assert exc.match("voltage/data: ")
+
+
+@pytest.mark.parametrize("char", ["\r", "\u2028", "\u0085"])
+def test_mapping_error_line_quoted_line_break(mapping, char):
+    # Line breaks inside quoted scalars don't affect the reported line number
+    mapping = mapping.replace("Test mapping", f"'Test{char}mapping'")
+    with pytest.raises(ValidationError, match="Unit .* is incompatible") as exc:
+        SignalMap.from_yaml(mapping.replace("[mV]", "[A.m]"))
+    assert exc.match("line 9")
+    assert exc.match("voltage/data: ")
+
+
 def test_mapping_unknown_dd(mapping):
     with pytest.raises(ValidationError, match="version 'abc' cannot be found") as exc:
         SignalMap.from_yaml(mapping.replace("4.0.0", "abc"))
@@ -5,6 +5,7 @@ from imas_iter_mapping import (
     UNIT_REGISTRY,
     ChannelSignal,
     UnitConversion,
+    apply_unit_conversion,
     get_unit_conversion_arrays,
 )
 
@@ -16,6 +17,8 @@ def test_unit_conversions():
     # Source and target are identical
     conversion = UnitConversion.calculate(Q("m"), U("m"))
     assert conversion == (1, 0)
+    conversion = UnitConversion.calculate(Q("degC"), U("degC"))
+    assert conversion == (1, 0)
 
     # Source and target are with different SI prefixes
     conversion = UnitConversion.calculate(Q("mm"), U("m"))
@@ -37,6 +40,18 @@ def test_unit_conversions():
     assert conversion == pytest.approx((5 / 9, 255.37222222222222), rel=1e-10)
 
 
+def test_unit_conversions_many():
+    pairs = [
+        (Q("m"), U("m")),
+        (Q("mm"), U("m")),
+        (Q("mm"), U("m")),
+        (Q("1e2 mm"), U("m")),
+        (Q("degC"), U("K")),
+    ]
+    conversions = UnitConversion.calculate_many(pairs)
+    assert conversions == [UnitConversion.calculate(*pair) for pair in pairs]
+
+
 def test_unit_conversion_arrays():
     signals = [
         ChannelSignal("N/A", "N/A", Q("m"), U("m")),
@@ -52,3 +67,28 @@ def test_unit_conversion_arrays():
     assert isinstance(offset, np.ndarray)
     assert np.allclose(scale, [1, 1e-3, 0.1, 1e-3, 1, 5 / 9], rtol=1e-10)
     assert np.allclose(offset, [0, 0, 0, 0, 273.15, 255.37222222222222], rtol=1e-10)
+
+
+def test_unit_conversion_arrays_empty():
+    scale, offset = get_unit_conversion_arrays([])
+    assert scale.shape == offset.shape == (0,)
+
+
+def test_apply_unit_conversion():
+    signals = [
+        ChannelSignal("N/A", "N/A", Q("mm"), U("m")),
+        ChannelSignal("N/A", "N/A", Q("degC"), U("K")),
+        ChannelSignal("N/A", "N/A", Q("degF"), U("K")),
+    ]
+    scale, offset = get_unit_conversion_arrays(signals)
+    data = np.array([[1000.0, 0.0, 32.0], [10.0, -273.15, 212.0]])
+    expected = [[1.0, 273.15, 273.15], [0.01, 0.0, 373.15]]
+
+    result = apply_unit_conversion(data, scale, offset)
+    assert result is not data
+    assert np.allclose(result, expected, rtol=1e-10)
+
+    # In-place conversion
+    result = apply_unit_conversion(data, scale, offset, out=data)
+    assert result is data
+    assert np.allclose(data, expected, rtol=1e-10)